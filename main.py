@@ -6,18 +6,27 @@ import asyncio
 import sys
 from pathlib import Path
 
+import aiohttp
+
 sys.path.insert(0, str(Path(__file__).parent))
 
 from src.collectors.historical_collector import HistoricalDataCollector
-from src.collectors.realtime_collector import RealtimeDataCollector
+from src.collectors.realtime_collector import KlineWriter, MultiSymbolCollector
 from src.database.connection import db
 from src.utils.config import Config
 from src.utils.logger import get_logger
 
+try:
+    # uvloop: daha hızlı event loop (Windows'ta yok), hem geçmiş hem real-time faz bunu kullanır
+    import uvloop
+    new_event_loop = uvloop.new_event_loop
+except ImportError:
+    new_event_loop = None  # standart asyncio loop
+
 logger = get_logger(__name__)
 
 
-def run_historical_collection():
+async def run_historical_collection():
     """Akıllı veri toplama - sadece eksik candle'ları çeker (tüm semboller için)"""
     logger.info("Eksik veriler kontrol ediliyor...")
 
@@ -28,17 +37,30 @@ def run_historical_collection():
 
         db.create_tables()
 
-        # Her sembol için ayrı collector oluştur
+        # Her sembol için ayrı collector oluştur ve hepsini paralel çalıştır
+        logger.info(f"\n{'='*60}")
+        logger.info(f"Processing {', '.join(Config.SYMBOLS)}")
+        logger.info(f"{'='*60}")
+
+        # Tüm collector'lar tek bir HTTP session (bağlantı havuzu) paylaşır
+        async with aiohttp.ClientSession() as http_session:
+            collectors = [
+                HistoricalDataCollector(symbol=symbol, http_session=http_session)
+                for symbol in Config.SYMBOLS
+            ]
+            results = await asyncio.gather(
+                *(collector.backfill_data(days=180) for collector in collectors),  # Son 6 ay kontrolü
+                return_exceptions=True
+            )
+
         total_all_symbols = 0
-        for symbol in Config.SYMBOLS:
-            logger.info(f"\n{'='*60}")
-            logger.info(f"Processing {symbol}")
-            logger.info(f"{'='*60}")
+        for symbol, result in zip(Config.SYMBOLS, results):
+            if isinstance(result, Exception):
+                logger.error(f"✗ {symbol}: {result}")
+                continue
 
-            collector = HistoricalDataCollector(symbol=symbol)
-            total_saved = collector.backfill_data(days=180)  # Son 6 ay kontrolü
-            total_all_symbols += total_saved
-            logger.info(f"✓ {symbol}: {total_saved} YENİ kayıt toplandı")
+            total_all_symbols += result
+            logger.info(f"✓ {symbol}: {result} YENİ kayıt toplandı")
 
         logger.info(f"\n{'='*60}")
         logger.info(f"TOPLAM: {total_all_symbols} YENİ kayıt toplandı")
@@ -60,24 +82,27 @@ async def run_realtime_collection():
 
         db.create_tables()
 
-        # Her sembol için ayrı collector oluştur
-        collectors = [RealtimeDataCollector(symbol=symbol) for symbol in Config.SYMBOLS]
+        # Tüm semboller tek bir combined WebSocket üzerinden, kapanan candle'lar tek bir writer üzerinden yazılır
+        writer = KlineWriter()
+        collector = MultiSymbolCollector(Config.SYMBOLS, writer=writer)
 
         # İlk kline'ları çek
-        for collector in collectors:
-            await collector.fetch_and_save_current_kline()
+        await collector.fetch_and_save_current_klines()
 
         logger.info(f"\nWebSocket streams başladı ({', '.join(Config.SYMBOLS)})")
         logger.info("Durdurmak için Ctrl+C\n")
 
-        # Tüm collector'ları paralel çalıştır
-        tasks = [collector.start() for collector in collectors]
-        await asyncio.gather(*tasks)
+        # Collector ve writer'ı paralel çalıştır
+        writer_task = asyncio.create_task(writer.run())
+        try:
+            await collector.start()
+        finally:
+            writer_task.cancel()
+            await asyncio.gather(writer_task, return_exceptions=True)
 
     except KeyboardInterrupt:
         logger.info("Durduruluyor...")
-        for collector in collectors:
-            collector.stop()
+        collector.stop()
     except Exception as e:
         logger.error(f"Hata: {e}")
         raise
@@ -91,7 +116,7 @@ async def main():
     print("=" * 60)
 
     # Akıllı veri toplama (sadece eksik candle'ları çeker)
-    run_historical_collection()
+    await run_historical_collection()
 
     # Sonra real-time'a geç
     await run_realtime_collection()
@@ -99,7 +124,8 @@ async def main():
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        with asyncio.Runner(loop_factory=new_event_loop) as runner:
+            runner.run(main())
     except KeyboardInterrupt:
         logger.info("\nDurduruldu")
     except Exception as e:
@@ -6,6 +6,8 @@ Deletes all collected OHLCV data from the database
 import sys
 from pathlib import Path
 
+from sqlalchemy import func, text
+
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -29,18 +31,15 @@ def cleanup_database(confirm: bool = False):
             logger.error("Database connection failed!")
             return False
 
-        # Get count before deletion
-        with db.get_session() as session:
-            total_records = session.query(OHLCVData).count()
-
-        if total_records == 0:
-            logger.info("Database is already empty. No records to delete.")
-            return True
+        # Confirm deletion (count is only needed for the prompt)
+        if not confirm:
+            with db.get_session() as session:
+                total_records = session.query(OHLCVData).count()
 
-        logger.info(f"Found {total_records:,} records in the database")
+            if total_records == 0:
+                logger.info("Database is already empty. No records to delete.")
+                return True
 
-        # Confirm deletion
-        if not confirm:
             print(f"\n{'='*60}")
             print(f"WARNING: You are about to delete {total_records:,} records!")
             print(f"{'='*60}")
@@ -54,10 +53,11 @@ def cleanup_database(confirm: bool = False):
         logger.info("Starting database cleanup...")
 
         with db.get_session() as session:
-            deleted_count = session.query(OHLCVData).delete()
+            # TRUNCATE empties the table in one step instead of a row-by-row DELETE
+            session.execute(text(f"TRUNCATE TABLE {OHLCVData.__tablename__} RESTART IDENTITY"))
             session.commit()
 
-        logger.info(f"✓ Successfully deleted {deleted_count:,} records")
+        logger.info("✓ Successfully deleted all records")
         logger.info("Database cleanup completed!")
 
         return True
@@ -80,18 +80,17 @@ def cleanup_specific_symbol(symbol: str, confirm: bool = False):
             logger.error("Database connection failed!")
             return False
 
-        with db.get_session() as session:
-            total_records = session.query(OHLCVData).filter(
-                OHLCVData.symbol == symbol
-            ).count()
-
-        if total_records == 0:
-            logger.info(f"No records found for {symbol}")
-            return True
+        # Count only when we need it for the confirmation prompt
+        if not confirm:
+            with db.get_session() as session:
+                total_records = session.query(OHLCVData).filter(
+                    OHLCVData.symbol == symbol
+                ).count()
 
-        logger.info(f"Found {total_records:,} records for {symbol}")
+            if total_records == 0:
+                logger.info(f"No records found for {symbol}")
+                return True
 
-        if not confirm:
             print(f"\n{'='*60}")
             print(f"WARNING: You are about to delete {total_records:,} records for {symbol}!")
             print(f"{'='*60}")
@@ -104,11 +103,16 @@ def cleanup_specific_symbol(symbol: str, confirm: bool = False):
         logger.info(f"Deleting records for {symbol}...")
 
         with db.get_session() as session:
+            # delete() returns the DELETE's rowcount
             deleted_count = session.query(OHLCVData).filter(
                 OHLCVData.symbol == symbol
-            ).delete()
+            ).delete(synchronize_session=False)
             session.commit()
 
+        if deleted_count == 0:
+            logger.info(f"No records found for {symbol}")
+            return True
+
         logger.info(f"✓ Successfully deleted {deleted_count:,} records for {symbol}")
 
         return True
@@ -126,12 +130,7 @@ def show_statistics():
             return
 
         with db.get_session() as session:
-            from sqlalchemy import func
-
-            # Total records
-            total = session.query(OHLCVData).count()
-
-            # Records per symbol
+            # Records per symbol (single aggregated query)
             stats = session.query(
                 OHLCVData.symbol,
                 func.count(OHLCVData.id).label('count'),
@@ -139,6 +138,9 @@ def show_statistics():
                 func.max(OHLCVData.timestamp_turkey).label('last')
             ).group_by(OHLCVData.symbol).all()
 
+        # Total records derived from the per-symbol counts
+        total = sum(stat.count for stat in stats)
+
         print(f"\n{'='*80}")
         print(f"DATABASE STATISTICS")
         print(f"{'='*80}")
@@ -0,0 +1,43 @@
+"""
+Shared Binance REST client
+One requests.Session (and connection pool) for every collector
+"""
+import threading
+from typing import Optional
+from binance.client import Client
+from requests.adapters import HTTPAdapter
+
+from ..utils.config import Config
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_client: Optional[Client] = None
+_client_lock = threading.Lock()
+
+
+def get_client(api_key: Optional[str] = None, api_secret: Optional[str] = None) -> Client:
+    """
+    Get the shared Binance client, creating it on first use
+    Avoids a new requests.Session (and TCP/TLS handshake) per symbol or collector
+
+    Thread-safe: gap fills call it from worker threads, and Client() pings Binance
+    on creation, so two threads must not both build one.
+
+    Args:
+        api_key: Binance API key (default: Config.BINANCE_API_KEY)
+        api_secret: Binance API secret (default: Config.BINANCE_API_SECRET)
+
+    Returns:
+        The shared Client
+    """
+    global _client
+
+    with _client_lock:
+        if _client is None:
+            # One pooled connection per symbol, with headroom for concurrent REST calls
+            pool_size = max(len(Config.SYMBOLS), 1)
+            _client = Client(api_key or Config.BINANCE_API_KEY, api_secret or Config.BINANCE_API_SECRET)
+            _client.session.mount('https://', HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size * 2))
+            logger.debug(f"Binance client created (connection pool size {pool_size * 2})")
+        return _client
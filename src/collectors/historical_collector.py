@@ -2,112 +2,205 @@
 Historical Data Collector using Binance REST API
 Fetches historical OHLCV data and stores in database
 """
-from binance.client import Client
-from datetime import datetime, timedelta, timezone
-from typing import Optional, List
+import asyncio
+import io
+import math
 import time
+from concurrent.futures import ThreadPoolExecutor
+import aiohttp
+import pandas as pd
+from aiolimiter import AsyncLimiter
+from binance.helpers import interval_to_milliseconds
+from datetime import datetime, timedelta, timezone
+from typing import Optional, List, Tuple
+from sqlalchemy import func, text
 
+from .binance_client import get_client
 from ..database.connection import db
-from ..database.models import OHLCVData
+from ..database.models import OHLCVData, TURKEY_OFFSET, upsert_klines
+from ..utils.candles import candle_start_ms, closed_candle_gap
 from ..utils.config import Config
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Binance REST endpoint for klines (public, no API key required)
+BINANCE_KLINES_URL = "https://api.binance.com/api/v3/klines"
+MAX_KLINES_PER_REQUEST = 1000
+
+# Binance request weight budget per minute; requests are only paced above the threshold
+WEIGHT_LIMIT_1M = 1200
+WEIGHT_BACKOFF_THRESHOLD = 1000
+MAX_FETCH_RETRIES = 5
+
+# Leading fields of a Binance kline: [open_time, open, high, low, close, volume, ...]
+KLINE_COLUMNS = ['open_time', 'open', 'high', 'low', 'close', 'volume']
+
+# Column order used for COPY FROM STDIN
+COPY_COLUMNS = (
+    'symbol', 'timeframe', 'timestamp_utc',
+    'open', 'high', 'low', 'close', 'volume'
+)
+
 
 class HistoricalDataCollector:
     """
     Collects historical OHLCV data from Binance using REST API
     """
 
-    def __init__(self, symbol: str, api_key: Optional[str] = None, api_secret: Optional[str] = None):
+    # Shared by all collectors so concurrent symbols stay under Binance's request limit
+    _rate_limiter = AsyncLimiter(1200, 60)
+
+    # Request weight used in the current minute, as last reported by Binance (per IP)
+    _used_weight = 0
+
+    # time.monotonic() until which no request may be sent, set by a 429/418 (the ban is per IP)
+    _blocked_until = 0.0
+
+    def __init__(
+        self,
+        symbol: str,
+        api_key: Optional[str] = None,
+        api_secret: Optional[str] = None,
+        max_concurrency: int = 5,
+        http_session: Optional[aiohttp.ClientSession] = None
+    ):
         """
-        Initialize Binance client
+        Initialize historical collector
         API keys are optional for public market data
+
+        Args:
+            max_concurrency: Maximum number of kline requests in flight during backfill
+            http_session: aiohttp session shared by all collectors (default: one per fetch_range call)
         """
         self.api_key = api_key or Config.BINANCE_API_KEY
         self.api_secret = api_secret or Config.BINANCE_API_SECRET
         self.symbol = symbol
         self.interval = Config.INTERVAL
+        self.interval_ms = interval_to_milliseconds(self.interval)
+        self.max_concurrency = max_concurrency
+        self.http_session = http_session
+
+        # Latest saved timestamp_utc, kept up to date by save_to_database
+        self._last_ts: Optional[datetime] = None
 
-        # Initialize Binance client
-        self.client = Client(self.api_key, self.api_secret)
         logger.info(f"Historical collector initialized for {self.symbol} ({self.interval})")
 
     def get_last_record_time(self) -> Optional[datetime]:
         """
         Get the timestamp of the last record in database
 
+        Only queries the database once per collector; afterwards the value
+        tracked in memory by save_to_database is returned.
+
         Returns:
             Last record timestamp or None if database is empty
         """
+        if self._last_ts is not None:
+            logger.info(f"Last record (cached, UTC): {self._last_ts}")
+            return self._last_ts
+
         try:
             with db.get_session() as session:
-                from sqlalchemy import func
-                last_record = session.query(func.max(OHLCVData.timestamp_turkey)).filter(
+                last_record = session.query(func.max(OHLCVData.timestamp_utc)).filter(
                     OHLCVData.symbol == self.symbol,
                     OHLCVData.timeframe == self.interval
                 ).scalar()
 
                 if last_record:
-                    logger.info(f"Last record in database (Turkey time): {last_record}")
+                    logger.info(f"Last record in database (UTC): {last_record}")
                 else:
                     logger.info("Database is empty, will fetch full 6 months")
 
+                self._last_ts = last_record
                 return last_record
         except Exception as e:
             logger.error(f"Error getting last record time: {e}")
             return None
 
-    def fetch_historical_klines(
-        self,
-        start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None,
-        limit: int = 1000
-    ) -> List[list]:
+    def _klines_to_frame(self, klines: List[list]) -> pd.DataFrame:
+        """
+        Convert klines to a frame of table rows (columns in COPY_COLUMNS order)
+
+        Only used for COPY, where the whole frame is written with one
+        to_csv call. Klines are expected to be closed candles only,
+        which _last_closed_ms guarantees for every request.
+        """
+        if not klines:
+            return pd.DataFrame(columns=COPY_COLUMNS)
+
+        frame = pd.DataFrame(klines).iloc[:, :len(KLINE_COLUMNS)]
+        frame.columns = KLINE_COLUMNS
+
+        # UTC timestamp from Binance, PostgreSQL generates timestamp_turkey from it
+        timestamp_utc = pd.to_datetime(frame['open_time'], unit='ms', utc=True)
+
+        rows = pd.DataFrame({
+            'symbol': self.symbol,
+            'timeframe': self.interval,
+            'timestamp_utc': timestamp_utc,
+            'open': frame['open'],
+            'high': frame['high'],
+            'low': frame['low'],
+            'close': frame['close'],
+            'volume': frame['volume']
+        }, columns=COPY_COLUMNS)
+
+        return rows
+
+    def _track_last_ts(self, klines: List[list]):
+        """Remember the newest saved candle so the next backfill can skip the MAX() query"""
+        latest = datetime.fromtimestamp(max(kline[0] for kline in klines) / 1000, tz=timezone.utc)
+        if self._last_ts is None or latest > self._last_ts:
+            self._last_ts = latest
+
+    def save_to_database(self, klines: List[list]) -> int:
         """
-        Fetch historical kline/candlestick data from Binance
+        Save klines to database
+
+        Uses a single INSERT ... ON CONFLICT DO UPDATE statement for the
+        whole batch instead of a SELECT + INSERT/UPDATE per kline.
 
         Args:
-            start_date: Start date for historical data (default: 30 days ago)
-            end_date: End date for historical data (default: now)
-            limit: Maximum number of klines to fetch (max 1000 per request)
+            klines: List of klines in Binance format
 
         Returns:
-            List of klines in Binance format
+            Number of records saved
         """
-        try:
-            # Set default dates if not provided
-            if not end_date:
-                end_date = datetime.now(timezone.utc)
-            if not start_date:
-                start_date = end_date - timedelta(days=30)
-
-            logger.info(f"Fetching historical data for {self.symbol} from {start_date} to {end_date}")
-
-            # Convert datetime to millisecond timestamp
-            start_str = str(int(start_date.timestamp() * 1000))
-            end_str = str(int(end_date.timestamp() * 1000))
-
-            # Fetch klines from Binance
-            klines = self.client.get_historical_klines(
-                symbol=self.symbol,
-                interval=self.interval,
-                start_str=start_str,
-                end_str=end_str,
-                limit=limit
-            )
-
-            logger.info(f"Fetched {len(klines)} klines from Binance")
-            return klines
+        if not klines:
+            return 0
 
-        except Exception as e:
-            logger.error(f"Error fetching historical data: {e}")
-            raise
+        rows = [
+            OHLCVData.row_from_binance_kline(kline, self.symbol, self.interval)
+            for kline in klines
+        ]
 
-    def save_to_database(self, klines: List[list]) -> int:
+        with db.get_session() as session:
+            try:
+                # Backfilled data can always be re-fetched, so don't wait for the WAL fsync on commit
+                session.execute(text("SET LOCAL synchronous_commit = OFF"))
+                inserted = upsert_klines(session, rows, return_inserted=True)
+                session.commit()
+            except Exception as e:
+                session.rollback()
+                logger.error(f"Error committing to database: {e}")
+                raise
+
+        self._track_last_ts(klines)
+
+        saved_count = sum(1 for is_new in inserted if is_new)
+        updated_count = len(inserted) - saved_count
+
+        logger.info(f"Saved {saved_count} new records, updated {updated_count} existing records")
+
+        return saved_count
+
+    def copy_to_database(self, klines: List[list]) -> int:
         """
-        Save klines to database (ONLY closed candles)
+        Bulk load klines with PostgreSQL COPY
+
+        COPY is the fastest way to load many rows but has no conflict
+        handling, so it is only used for symbols with no data yet.
 
         Args:
             klines: List of klines in Binance format
@@ -115,72 +208,38 @@ class HistoricalDataCollector:
         Returns:
             Number of records saved
         """
-        from sqlalchemy import and_
-
-        saved_count = 0
-        skipped_count = 0
-        open_candle_count = 0
+        rows = self._klines_to_frame(klines)
 
-        # Current time in UTC
-        current_time_utc = datetime.now(timezone.utc)
+        if rows.empty:
+            return 0
 
-        with db.get_session() as session:
-            for kline in klines:
-                # Kline close time (when the candle closes)
-                # kline[6] is the close time in milliseconds
-                candle_close_time = datetime.fromtimestamp(kline[6] / 1000, tz=timezone.utc)
-
-                # SADECE KAPALI candleları kaydet
-                # Eğer candle'ın close time'ı henüz gelmemişse (açık candle), atla
-                if candle_close_time > current_time_utc:
-                    open_candle_count += 1
-                    continue
+        buffer = io.StringIO()
+        rows.to_csv(buffer, header=False, index=False)
+        buffer.seek(0)
 
-                # Create OHLCVData object
-                ohlcv = OHLCVData.from_binance_kline(
-                    kline=kline,
-                    symbol=self.symbol,
-                    timeframe=self.interval
-                )
-
-                # Check if record already exists (using Turkey timestamp)
-                existing = session.query(OHLCVData).filter(
-                    and_(
-                        OHLCVData.timestamp_turkey == ohlcv.timestamp_turkey,
-                        OHLCVData.symbol == ohlcv.symbol,
-                        OHLCVData.timeframe == ohlcv.timeframe
-                    )
-                ).first()
-
-                if existing:
-                    # Update existing record
-                    existing.timestamp_utc = ohlcv.timestamp_utc
-                    existing.open = ohlcv.open
-                    existing.high = ohlcv.high
-                    existing.low = ohlcv.low
-                    existing.close = ohlcv.close
-                    existing.volume = ohlcv.volume
-                    skipped_count += 1
-                else:
-                    # Add new record
-                    session.add(ohlcv)
-                    saved_count += 1
+        copy_sql = (
+            f"COPY {OHLCVData.__tablename__} ({', '.join(COPY_COLUMNS)}) "
+            f"FROM STDIN WITH CSV"
+        )
 
-            # Commit all at once
+        with db.get_session() as session:
             try:
+                session.execute(text("SET LOCAL synchronous_commit = OFF"))
+                # Raw psycopg2 cursor, COPY is not exposed through the ORM
+                with session.connection().connection.cursor() as cursor:
+                    cursor.copy_expert(copy_sql, buffer)
                 session.commit()
-                if open_candle_count > 0:
-                    logger.info(f"Saved {saved_count} new records, updated {skipped_count} existing records, skipped {open_candle_count} open candles")
-                else:
-                    logger.info(f"Saved {saved_count} new records, updated {skipped_count} existing records")
             except Exception as e:
                 session.rollback()
-                logger.error(f"Error committing to database: {e}")
+                logger.error(f"Error copying to database: {e}")
                 raise
 
-        return saved_count
+        self._track_last_ts(klines)
 
-    def backfill_data(self, days: int = 180) -> int:
+        logger.info(f"Copied {len(rows)} new records")
+        return len(rows)
+
+    async def backfill_data(self, days: int = 180) -> int:
         """
         Akıllı veri toplama: Sadece eksik olan candle'ları çeker
         
@@ -189,7 +248,7 @@ class HistoricalDataCollector:
         """
         logger.info(f"Starting smart backfill (max {days} days)")
         
-        last_record_time_turkey = self.get_last_record_time()
+        last_record_utc = self.get_last_record_time()
 
         # Get current time in UTC
         local_time = datetime.now()
@@ -199,39 +258,29 @@ class HistoricalDataCollector:
         logger.info(f"Current time (UTC): {current_time_utc}")
 
         # Veritabanı tamamen boşsa: Son {days} günü çek
-        if last_record_time_turkey is None:
+        if last_record_utc is None:
             logger.info(f"Database is empty. Fetching last {days} days of data...")
             start_time = current_time_utc - timedelta(days=days)
-            total_saved = self.fetch_range(start_time, current_time_utc)
+            total_saved = await self.fetch_range(start_time, current_time_utc, use_copy=True)
             logger.info(f"✓ Initial data collection: {total_saved} candles saved")
             return total_saved
 
-        # Convert Turkey time to UTC for calculations
-        last_record_utc = last_record_time_turkey - timedelta(hours=3)
-
         # Veritabanında veri varsa: Eksik candle'ları kontrol et
         max_start_time = current_time_utc - timedelta(days=days)
 
         if last_record_utc < max_start_time:
             start_time = max_start_time
-            logger.warning(f"Last record too old (Turkey: {last_record_time_turkey}), starting from {days} days ago")
+            logger.warning(f"Last record too old (Turkey: {last_record_utc + TURKEY_OFFSET}), starting from {days} days ago")
         else:
-            start_time = last_record_utc + timedelta(minutes=5)
+            start_time = last_record_utc + timedelta(milliseconds=self.interval_ms)
 
-        # Eksik candle sayısını hesapla (UTC ile)
-        # Sadece KAPANMIŞ candle'ları say (şu anki açık candle'ı dahil etme)
-        missing_time = current_time_utc - last_record_utc
-        estimated_missing = missing_time.total_seconds() / (5 * 60)
+        # Eksik (kapanmış) candle sayısını hesapla
+        open_candle_start, estimated_missing = closed_candle_gap(last_record_utc, current_time_utc, self.interval_ms)
+        missing_time = open_candle_start - last_record_utc
 
-        # Şu anki açık candle'ı çıkar (henüz kapanmamış)
-        minutes_since_candle_start = current_time_utc.minute % 5
-        if minutes_since_candle_start < 5:
-            # Henüz kapanmamış bir candle var, onu sayma
-            estimated_missing = max(0, estimated_missing - 1)
-
-        logger.info(f"Last record UTC: {last_record_utc} (Turkey: {last_record_time_turkey})")
+        logger.info(f"Last record UTC: {last_record_utc} (Turkey: {last_record_utc + TURKEY_OFFSET})")
         logger.info(f"Missing time: {missing_time}")
-        logger.info(f"Estimated missing CLOSED candles: {int(estimated_missing)}")
+        logger.info(f"Estimated missing CLOSED candles: {estimated_missing}")
 
         # Eksik candle yoksa çık
         if estimated_missing < 1:
@@ -240,75 +289,227 @@ class HistoricalDataCollector:
         
         # Eksik candle'ları doldur (UTC zamanlarıyla)
         logger.info(f"Filling gap: {start_time} → {current_time_utc}")
-        total_saved = self.fetch_range(start_time, current_time_utc)
+        total_saved = await self.fetch_range(start_time, current_time_utc)
 
         return total_saved
 
-    def fetch_range(self, start_time: datetime, end_time: datetime) -> int:
+    def _last_closed_ms(self, end_time: datetime) -> int:
+        """
+        Latest request endTime (ms) that only covers closed candles
+
+        Capping endTime just before the current candle boundary means
+        Binance never returns the candle that is still forming.
+        """
+        end_ms = int(min(end_time, datetime.now(timezone.utc)).timestamp() * 1000)
+        return candle_start_ms(end_ms, self.interval_ms) - 1
+
+    def _build_windows(self, start_time: datetime, end_time: datetime) -> List[Tuple[int, int]]:
+        """
+        Split a time range into request windows of at most 1000 candles
+
+        Window starts are aligned to candle open times, so every window but
+        the last holds exactly 1000 candles and the list depends only on
+        the range, not on what Binance returns.
+
+        Returns:
+            List of (start_ms, end_ms) tuples, both inclusive
+        """
+        # First candle opening at or after start_time
+        start_ms = math.ceil(start_time.timestamp() * 1000 / self.interval_ms) * self.interval_ms
+        end_ms = self._last_closed_ms(end_time)
+        window_ms = MAX_KLINES_PER_REQUEST * self.interval_ms
+
+        if start_ms > end_ms:
+            return []
+
+        window_count = math.ceil((end_ms - start_ms + 1) / window_ms)
+        return [
+            (start_ms + i * window_ms, min(start_ms + (i + 1) * window_ms - 1, end_ms))
+            for i in range(window_count)
+        ]
+
+    async def _fetch_window(self, session: aiohttp.ClientSession, start_ms: int, end_ms: int) -> List[list]:
+        """
+        Fetch a single window of klines directly from the Binance REST API
+
+        Rate limits (429/418) wait for Binance's Retry-After, server errors and
+        network failures are retried with exponential backoff.
+
+        Args:
+            session: Shared aiohttp session (keeps connections alive between requests)
+            start_ms: Window start time in milliseconds
+            end_ms: Window end time in milliseconds
+
+        Returns:
+            List of klines in Binance format (empty list on error)
+        """
+        params = {
+            'symbol': self.symbol,
+            'interval': self.interval,
+            'startTime': start_ms,
+            'endTime': end_ms,
+            'limit': MAX_KLINES_PER_REQUEST
+        }
+
+        for attempt in range(1, MAX_FETCH_RETRIES + 1):
+            retry_delay = None
+
+            # A 429/418 seen by any window pauses every collector, not just the one that got it
+            await self._wait_if_blocked()
+
+            try:
+                async with self._rate_limiter:
+                    async with session.get(BINANCE_KLINES_URL, params=params) as response:
+                        self._record_used_weight(response)
+
+                        if response.status in (418, 429):
+                            # Rate limited (418 = IP banned for ignoring 429s), Binance says how long to wait
+                            retry_delay = int(response.headers.get('Retry-After', 60))
+                            self._block_requests(retry_delay)
+                            logger.warning(f"Rate limited by Binance ({response.status}), retrying in {retry_delay}s")
+                        elif response.status >= 500:
+                            retry_delay = 2 ** attempt
+                            logger.warning(f"Binance server error ({response.status}), retrying in {retry_delay}s")
+                        else:
+                            response.raise_for_status()
+                            klines = await response.json()
+
+            except aiohttp.ClientResponseError as e:
+                # Other 4xx errors (bad symbol/params) won't succeed on retry
+                logger.error(f"Error fetching klines for {self.symbol} ({start_ms} → {end_ms}): {e}")
+                return []
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                retry_delay = 2 ** attempt
+                logger.warning(f"Network error fetching klines for {self.symbol}: {e}, retrying in {retry_delay}s")
+
+            if retry_delay is None:
+                # Empty list is a normal answer (no trading in this window)
+                await self._pace_requests()
+                return klines
+
+            await asyncio.sleep(retry_delay)
+
+        logger.error(f"Giving up on klines for {self.symbol} ({start_ms} → {end_ms}) after {MAX_FETCH_RETRIES} attempts")
+        return []
+
+    @classmethod
+    def _record_used_weight(cls, response: aiohttp.ClientResponse):
+        """Remember the request weight Binance reports as used in the current minute"""
+        used_weight = response.headers.get('X-MBX-USED-WEIGHT-1M')
+        if used_weight is not None:
+            cls._used_weight = int(used_weight)
+
+    @classmethod
+    def _block_requests(cls, seconds: int):
+        """Stop all collectors from sending requests for the next `seconds` seconds"""
+        cls._blocked_until = max(cls._blocked_until, time.monotonic() + seconds)
+
+    @classmethod
+    async def _wait_if_blocked(cls):
+        """Wait while Binance has asked us (via Retry-After) to stop sending requests"""
+        while (remaining := cls._blocked_until - time.monotonic()) > 0:
+            await asyncio.sleep(remaining)
+
+    @classmethod
+    async def _pace_requests(cls):
+        """Wait for the next weight window, but only when close to Binance's per-minute limit"""
+        if cls._used_weight <= WEIGHT_BACKOFF_THRESHOLD:
+            return
+
+        # Binance resets the used weight at the start of every minute
+        wait_seconds = 60 - datetime.now(timezone.utc).second
+        logger.info(f"Used weight {cls._used_weight}/{WEIGHT_LIMIT_1M}, pausing {wait_seconds}s")
+        await asyncio.sleep(wait_seconds)
+        cls._used_weight = 0
+
+    async def fetch_range(self, start_time: datetime, end_time: datetime, use_copy: bool = False) -> int:
         """
         Fetch all candles in a time range
 
+        The range is split into 1000-candle windows which are downloaded
+        concurrently (bounded by max_concurrency) and then saved in order.
+
         Args:
             start_time: Start datetime (timezone-aware)
             end_time: End datetime (timezone-aware)
+            use_copy: Load the whole range with one COPY (only safe when the range has no data yet)
 
         Returns:
             Total number of NEW candles saved
         """
-        from datetime import timezone
+        windows = self._build_windows(start_time, end_time)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
 
-        total_saved = 0
-        current_start = start_time
-        max_iterations = 500
-        iteration = 0
+        logger.info(f"Fetching range: {start_time} → {end_time} ({len(windows)} requests)")
+
+        # Reuse the shared session so concurrent symbols share connections (and TLS sessions)
+        session = self.http_session or aiohttp.ClientSession()
 
-        logger.info(f"Fetching range: {start_time} → {end_time}")
+        try:
+            async def fetch(window: Tuple[int, int]) -> List[list]:
+                async with semaphore:
+                    return await self._fetch_window(session, *window)
 
-        while current_start < end_time and iteration < max_iterations:
-            iteration += 1
+            fetch_tasks = [asyncio.create_task(fetch(window)) for window in windows]
 
             try:
-                # Fetch batch of klines
-                klines = self.fetch_historical_klines(
-                    start_date=current_start,
-                    end_date=end_time,
-                    limit=1000
-                )
+                if use_copy:
+                    results = await asyncio.gather(*fetch_tasks)
+                    all_klines = [kline for klines in results for kline in klines]
+                    try:
+                        total_saved = await asyncio.to_thread(self.copy_to_database, all_klines)
+                        logger.info(f"✓ Fetched {total_saved} NEW candles from range")
+                        return total_saved
+                    except Exception as e:
+                        # e.g. rows written by another process meanwhile, fall back to upserts
+                        logger.warning(f"COPY failed, falling back to batched upserts: {e}")
+
+                total_saved = await self._save_as_fetched(fetch_tasks)
+            finally:
+                for task in fetch_tasks:
+                    task.cancel()
+        finally:
+            if session is not self.http_session:
+                await session.close()
 
-                if not klines:
-                    # No data returned, skip forward
-                    if (end_time - current_start).total_seconds() > 300:
-                        logger.warning(f"No klines returned, skipping 1 hour forward")
-                        current_start += timedelta(hours=1)
-                        continue
-                    else:
-                        break
-
-                # Save to database
-                saved = self.save_to_database(klines)
-                total_saved += saved
-
-                # Move to next batch
-                last_kline_time = datetime.fromtimestamp(klines[-1][0] / 1000, tz=timezone.utc)
-                next_start = last_kline_time + timedelta(minutes=5)
-
-                # Prevent infinite loop
-                if next_start <= current_start:
-                    logger.warning(f"Time not advancing, forcing skip")
-                    current_start += timedelta(hours=1)
-                else:
-                    current_start = next_start
+        logger.info(f"✓ Fetched {total_saved} NEW candles from range")
+        return total_saved
+
+    async def _save_as_fetched(self, fetch_tasks: List[asyncio.Task]) -> int:
+        """
+        Save windows in order as their downloads finish
 
-                # Rate limiting
-                time.sleep(0.1)
+        DB writes run one at a time on a background thread, so the commit
+        of one window overlaps with downloading the next ones.
 
+        Returns:
+            Total number of NEW candles saved
+        """
+        loop = asyncio.get_running_loop()
+        total_saved = 0
+        pending_save: Optional[asyncio.Future] = None
+
+        async def collect(future: asyncio.Future) -> int:
+            try:
+                return await future
             except Exception as e:
-                logger.error(f"Error fetching range: {e}")
-                current_start += timedelta(hours=1)
-                if current_start >= end_time:
-                    break
+                logger.error(f"Error saving range batch: {e}")
+                return 0
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            for task in fetch_tasks:
+                klines = await task
+                if not klines:
+                    continue
+
+                # Keep at most one write in flight so batches are committed in order
+                if pending_save is not None:
+                    total_saved += await collect(pending_save)
+                pending_save = loop.run_in_executor(executor, self.save_to_database, klines)
+
+            if pending_save is not None:
+                total_saved += await collect(pending_save)
 
-        logger.info(f"✓ Fetched {total_saved} NEW candles from range")
         return total_saved
 
     def get_latest_price(self) -> dict:
@@ -319,7 +520,8 @@ class HistoricalDataCollector:
             Dictionary with latest price information
         """
         try:
-            ticker = self.client.get_symbol_ticker(symbol=self.symbol)
+            client = get_client(self.api_key, self.api_secret)
+            ticker = client.get_symbol_ticker(symbol=self.symbol)
             logger.info(f"Latest price for {self.symbol}: {ticker['price']}")
             return ticker
         except Exception as e:
@@ -327,7 +529,7 @@ class HistoricalDataCollector:
             raise
 
 
-def main():
+async def main():
     """Main function for testing historical collector"""
     logger.info("Starting Historical Data Collector")
 
@@ -339,24 +541,25 @@ def main():
     # Create tables if they don't exist
     db.create_tables()
 
-    # Collect data for all symbols
-    for symbol in Config.SYMBOLS:
-        logger.info(f"\n{'='*60}")
-        logger.info(f"Processing {symbol}")
-        logger.info(f"{'='*60}")
+    # Collect data for all symbols, sharing one HTTP session
+    async with aiohttp.ClientSession() as http_session:
+        for symbol in Config.SYMBOLS:
+            logger.info(f"\n{'='*60}")
+            logger.info(f"Processing {symbol}")
+            logger.info(f"{'='*60}")
 
-        # Initialize collector for this symbol
-        collector = HistoricalDataCollector(symbol=symbol)
+            # Initialize collector for this symbol
+            collector = HistoricalDataCollector(symbol=symbol, http_session=http_session)
 
-        # Get latest price
-        latest_price = collector.get_latest_price()
-        logger.info(f"Current {symbol} price: ${latest_price['price']}")
+            # Get latest price
+            latest_price = collector.get_latest_price()
+            logger.info(f"Current {symbol} price: ${latest_price['price']}")
 
-        # Backfill last 30 days of data
-        collector.backfill_data(days=30)
+            # Backfill last 30 days of data
+            await collector.backfill_data(days=30)
 
     logger.info("\n✓ Historical data collection completed for all symbols")
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
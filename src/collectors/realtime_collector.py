@@ -4,45 +4,159 @@ Streams live OHLCV data and updates database every 5 minutes
 """
 import asyncio
 import json
-from datetime import datetime, timedelta
-from typing import Optional
+import time
+from operator import itemgetter
+from datetime import datetime, timezone
+from typing import Optional, List, Dict, Any
 import websockets
-from binance.client import Client
+from sqlalchemy import func
+from binance.helpers import interval_to_milliseconds
 
-from ..database.connection import db
-from ..database.models import OHLCVData
+from .binance_client import get_client
+from ..database.connection import db, PersistentSession
+from ..database.models import OHLCVData, TURKEY_OFFSET, upsert_klines
+from ..utils.candles import closed_candle_gap
 from ..utils.config import Config
 from ..utils.logger import get_logger
 
+try:
+    # orjson parses kline frames ~3x faster than the stdlib; its JSONDecodeError subclasses json's
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
 logger = get_logger(__name__)
 
+# Log level is fixed at startup, check it once instead of formatting debug output per frame
+DEBUG_ENABLED = logger.level(Config.LOG_LEVEL).no <= logger.level("DEBUG").no
+
+# WebSocket kline payload fields used for storage: (open_time, open, high, low, close, volume)
+WS_KLINE_FIELDS = itemgetter('t', 'o', 'h', 'l', 'c', 'v')
+
+# Binance sends compact JSON, a closed candle always carries this exact substring
+CLOSED_KLINE_MARKER = '"x":true'
+
+
+class KlineWriter:
+    """
+    Buffers closed candles from all real-time collectors and writes them in batches
+    One bulk upsert per flush instead of one transaction per candle per symbol
+    """
+
+    def __init__(self, batch_size: int = 50, flush_interval: float = 5.0):
+        """
+        Args:
+            batch_size: Flush as soon as this many candles are buffered
+            flush_interval: Flush buffered candles at least this often (seconds)
+        """
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        # One long-lived session for all flushes instead of a pool checkout per batch
+        self._db_session = db.persistent_session()
+
+    async def put(self, row: Dict[str, Any]):
+        """Queue a closed candle (OHLCVData column mapping) for writing"""
+        await self.queue.put(row)
+
+    def write_rows(self, rows: List[Dict[str, Any]]) -> int:
+        """
+        Upsert rows into the database with a single statement
+
+        Returns:
+            Number of rows written
+        """
+        # The same candle may be queued twice (e.g. after a reconnect), keep the latest
+        unique_rows = {
+            (row['timestamp_utc'], row['symbol'], row['timeframe']): row
+            for row in rows
+        }
+
+        self._db_session.run(lambda session: upsert_klines(session, list(unique_rows.values())))
+
+        return len(unique_rows)
+
+    async def flush(self, rows: List[Dict[str, Any]]):
+        """Write buffered rows without blocking the event loop"""
+        try:
+            written = await asyncio.to_thread(self.write_rows, rows)
+            symbols = sorted({row['symbol'] for row in rows})
+            logger.info(f"✓ Saved {written} candles ({', '.join(symbols)})")
+        except Exception as e:
+            logger.error(f"Error writing candles to database: {e}")
+
+    async def run(self):
+        """Consume the queue until cancelled, flushing by batch size or flush_interval"""
+        buffer: List[Dict[str, Any]] = []
+        deadline: Optional[float] = None  # flush time for the oldest buffered candle
+        flush_task: Optional[asyncio.Task] = None
+
+        try:
+            while True:
+                timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+                try:
+                    buffer.append(await asyncio.wait_for(self.queue.get(), timeout=timeout))
+                    if deadline is None:
+                        deadline = time.monotonic() + self.flush_interval
+                except asyncio.TimeoutError:
+                    pass
+
+                if buffer and (len(buffer) >= self.batch_size or time.monotonic() >= deadline):
+                    rows, buffer, deadline = buffer, [], None
+                    # Shielded: cancelling run() must not abandon a write running on another thread
+                    flush_task = asyncio.ensure_future(self.flush(rows))
+                    await asyncio.shield(flush_task)
+        finally:
+            # Let an in-flight flush finish before touching the session again
+            if flush_task is not None and not flush_task.done():
+                await flush_task
+
+            # Don't lose buffered or still queued candles on shutdown
+            while not self.queue.empty():
+                buffer.append(self.queue.get_nowait())
+
+            if buffer:
+                try:
+                    self.write_rows(buffer)
+                except Exception as e:
+                    logger.error(f"Error writing candles on shutdown: {e}")
+            self._db_session.close()
+
 
 class RealtimeDataCollector:
     """
-    Collects real-time OHLCV data from Binance using WebSocket API
-    Updates database every time a 5-minute candle closes
+    Per-symbol part of the real-time collector: gap fill and storage of closed candles
+    The WebSocket stream itself is owned by MultiSymbolCollector
     """
 
-    def __init__(self, symbol: str, api_key: Optional[str] = None, api_secret: Optional[str] = None):
-        """Initialize WebSocket collector for a specific symbol"""
+    def __init__(
+        self,
+        symbol: str,
+        api_key: Optional[str] = None,
+        api_secret: Optional[str] = None,
+        writer: Optional[KlineWriter] = None
+    ):
+        """
+        Initialize real-time collector for a specific symbol
+
+        Args:
+            writer: Shared batch writer for closed candles (default: save each candle directly)
+        """
         self.api_key = api_key or Config.BINANCE_API_KEY
         self.api_secret = api_secret or Config.BINANCE_API_SECRET
         self.symbol = symbol
         self.interval = Config.INTERVAL
+        self.writer = writer
 
-        # WebSocket URL for kline/candlestick streams
-        # Format: wss://stream.binance.com:9443/ws/<symbol>@kline_<interval>
-        self.ws_url = f"wss://stream.binance.com:9443/ws/{self.symbol.lower()}@kline_{self.interval}"
-
-        # Connection state
-        self.is_running = False
-        self.websocket = None
+        # Long-lived session for per-candle saves, only needed when there is no shared writer
+        self._db_session: Optional[PersistentSession] = db.persistent_session() if writer is None else None
 
         # Binance client for REST API fallback
-        self.client = Client(self.api_key, self.api_secret)
+        self.client = get_client(self.api_key, self.api_secret)
 
         logger.info(f"Real-time collector initialized for {self.symbol} ({self.interval})")
-        logger.info(f"WebSocket URL: {self.ws_url}")
 
     def save_kline_to_database(self, kline_data: dict) -> bool:
         """
@@ -63,56 +177,23 @@ class RealtimeDataCollector:
                 logger.debug(f"Candle not closed yet for {self.symbol} at {kline['t']}")
                 return False
 
-            # Save to database
-            with db.get_session() as session:
-                from sqlalchemy import and_
-                from datetime import timezone as tz
-
-                # Create timestamps (UTC and Turkey)
-                utc_time = datetime.fromtimestamp(kline['t'] / 1000, tz=tz.utc)
-                turkey_time = utc_time + timedelta(hours=3)  # Add 3 hours for Turkey time
-
-                # Check if already exists (using Turkey timestamp)
-                existing = session.query(OHLCVData).filter(
-                    and_(
-                        OHLCVData.timestamp_turkey == turkey_time,
-                        OHLCVData.symbol == self.symbol,
-                        OHLCVData.timeframe == self.interval
-                    )
-                ).first()
-
-                if existing:
-                    # Update existing record
-                    existing.timestamp_utc = utc_time
-                    existing.open = float(kline['o'])
-                    existing.high = float(kline['h'])
-                    existing.low = float(kline['l'])
-                    existing.close = float(kline['c'])
-                    existing.volume = float(kline['v'])
-                else:
-                    # Create new record inside session
-                    ohlcv = OHLCVData(
-                        timestamp_utc=utc_time,
-                        timestamp_turkey=turkey_time,
-                        symbol=self.symbol,
-                        timeframe=self.interval,
-                        open=float(kline['o']),
-                        high=float(kline['h']),
-                        low=float(kline['l']),
-                        close=float(kline['c']),
-                        volume=float(kline['v'])
-                    )
-                    session.add(ohlcv)
-
-                session.commit()
+            # Save to database with a single upsert (no SELECT round-trip)
+            row = self.row_from_kline(kline)
 
-                # Log after commit
-                logger.info(
-                    f"✓ Saved {self.symbol} candle | "
-                    f"Turkey: {turkey_time} | UTC: {utc_time} | "
-                    f"Close: ${float(kline['c']):.2f} | "
-                    f"Volume: {float(kline['v']):.4f}"
-                )
+            if self._db_session is not None:
+                self._db_session.run(lambda session: upsert_klines(session, [row]))
+            else:
+                # Closed candles normally go through the shared writer, this is a one-off save
+                with db.get_session() as session:
+                    upsert_klines(session, [row])
+
+            # Log after commit
+            logger.info(
+                f"✓ Saved {self.symbol} candle | "
+                f"Turkey: {row['timestamp_utc'] + TURKEY_OFFSET} | UTC: {row['timestamp_utc']} | "
+                f"Close: ${row['close']:.2f} | "
+                f"Volume: {row['volume']:.4f}"
+            )
 
             return True
 
@@ -120,139 +201,74 @@ class RealtimeDataCollector:
             logger.error(f"Error saving kline to database: {e}")
             return False
 
-    async def handle_message(self, message: str):
+    def row_from_kline(self, kline: dict) -> Dict[str, Any]:
+        """Build an OHLCVData column mapping from a WebSocket kline payload"""
+        open_ms, o, h, l, c, v = WS_KLINE_FIELDS(kline)
+        utc_time = datetime.fromtimestamp(open_ms / 1000, tz=timezone.utc)
+
+        return {
+            'timestamp_utc': utc_time,
+            'symbol': self.symbol,
+            'timeframe': self.interval,
+            'open': float(o),
+            'high': float(h),
+            'low': float(l),
+            'close': float(c),
+            'volume': float(v)
+        }
+
+    async def handle_kline_event(self, data: dict):
         """
-        Handle incoming WebSocket message
+        Handle a decoded kline event for this symbol
 
         Args:
-            message: Raw WebSocket message (JSON string)
+            data: Kline event payload ({"e": "kline", "s": ..., "k": {...}})
         """
-        try:
-            data = json.loads(message)
+        # Check if this is a kline message
+        if 'e' in data and data['e'] == 'kline':
+            kline = data['k']
 
-            # Check if this is a kline message
-            if 'e' in data and data['e'] == 'kline':
-                kline = data['k']
-
-                # Log current candle info
+            # Log current candle info
+            if DEBUG_ENABLED:
                 logger.debug(
                     f"Candle update | "
                     f"Symbol: {kline['s']} | "
-                    f"Close: ${float(kline['c']):.2f} | "
-                    f"Volume: {float(kline['v']):.4f} | "
+                    f"Close: {kline['c']} | "
+                    f"Volume: {kline['v']} | "
                     f"Closed: {kline['x']}"
                 )
 
-                # Save to database when candle closes (every 5 minutes)
-                if kline['x']:  # x = is candle closed
-                    self.save_kline_to_database(data)
-
-        except json.JSONDecodeError as e:
-            logger.error(f"Error decoding WebSocket message: {e}")
-        except Exception as e:
-            logger.error(f"Error handling message: {e}")
-
-    async def connect_and_stream(self):
-        """
-        Connect to WebSocket and start streaming data
-        Automatically reconnects on connection loss
-        """
-        retry_count = 0
-        max_retries = 5
-        retry_delay = 5  # seconds
-
-        while self.is_running and retry_count < max_retries:
-            try:
-                logger.info(f"Connecting to Binance WebSocket... (Attempt {retry_count + 1})")
-
-                async with websockets.connect(self.ws_url) as websocket:
-                    self.websocket = websocket
-                    logger.info("✓ Connected to Binance WebSocket")
-                    logger.info(f"Streaming {self.symbol} {self.interval} candles...")
-
-                    # Reset retry count on successful connection
-                    retry_count = 0
-
-                    # Listen for messages
-                    async for message in websocket:
-                        if not self.is_running:
-                            break
-                        await self.handle_message(message)
-
-            except websockets.exceptions.ConnectionClosed as e:
-                logger.warning(f"WebSocket connection closed: {e}")
-                retry_count += 1
-
-                if retry_count < max_retries:
-                    logger.info(f"Reconnecting in {retry_delay} seconds...")
-                    await asyncio.sleep(retry_delay)
+            # Save to database when candle closes (every 5 minutes)
+            if kline['x']:  # x = is candle closed
+                if self.writer:
+                    await self.writer.put(self.row_from_kline(kline))
                 else:
-                    logger.error("Max retries reached. Stopping collector.")
-                    self.is_running = False
-
-            except Exception as e:
-                logger.error(f"WebSocket error: {e}")
-                retry_count += 1
-
-                if retry_count < max_retries:
-                    logger.info(f"Retrying in {retry_delay} seconds...")
-                    await asyncio.sleep(retry_delay)
-                else:
-                    logger.error("Max retries reached. Stopping collector.")
-                    self.is_running = False
-
-    async def start(self):
-        """Start the real-time data collector"""
-        logger.info("Starting Real-time Data Collector")
-
-        # Test database connection
-        if not db.test_connection():
-            logger.error("Database connection failed. Cannot start collector.")
-            return
-
-        # Create tables if they don't exist
-        db.create_tables()
-
-        # IMPORTANT: Fill any missing candles before starting WebSocket
-        logger.info("Checking for missing candles before real-time stream...")
-        await self.fill_missing_candles_before_start()
-
-        # Start streaming
-        self.is_running = True
-
-        try:
-            await self.connect_and_stream()
-        except KeyboardInterrupt:
-            logger.info("Received interrupt signal. Stopping collector...")
-            self.stop()
-        except Exception as e:
-            logger.error(f"Unexpected error: {e}")
-            self.stop()
+                    await asyncio.to_thread(self.save_kline_to_database, data)
 
     async def fill_missing_candles_before_start(self):
         """
         Fill any missing candles between last record and now using REST API
         This ensures no gaps when real-time collector starts
+
+        The REST calls and database writes block, so they run in a worker thread
+        and the gap fills of several symbols can overlap.
         """
-        try:
-            from datetime import timezone
-            from sqlalchemy import func
+        await asyncio.to_thread(self._fill_missing_candles)
 
-            # Get last record timestamp (Turkey time)
+    def _fill_missing_candles(self):
+        """Blocking part of fill_missing_candles_before_start"""
+        try:
+            # Get last record timestamp (UTC)
             with db.get_session() as session:
-                last_record = session.query(func.max(OHLCVData.timestamp_turkey)).filter(
+                last_record_utc = session.query(func.max(OHLCVData.timestamp_utc)).filter(
                     OHLCVData.symbol == self.symbol,
                     OHLCVData.timeframe == self.interval
                 ).scalar()
 
-            if not last_record:
+            if not last_record_utc:
                 logger.info("No previous records, skipping gap fill")
                 return
 
-            # last_record is Turkey time (+3 hours), convert to UTC for comparison
-            last_record_turkey = last_record
-            last_record_utc = last_record - timedelta(hours=3)
-
             # Get current local time and convert to UTC
             local_time = datetime.now()
             now_utc = local_time.astimezone(timezone.utc)
@@ -261,15 +277,9 @@ class RealtimeDataCollector:
             logger.info(f"Local time: {local_time}")
             logger.info(f"Current time (UTC): {now_utc}")
 
-            # Calculate missing time (compare Turkey times)
-            time_diff = now_utc - last_record_utc
-            missing_candles = int(time_diff.total_seconds() / 300)  # 5 minutes = 300 seconds
-
-            # Exclude current open candle (not yet closed)
-            minutes_since_candle_start = now_utc.minute % 5
-            if minutes_since_candle_start < 5:
-                # There's an open candle, don't count it
-                missing_candles = max(0, missing_candles - 1)
+            interval_ms = interval_to_milliseconds(self.interval)
+            open_candle_start, missing_candles = closed_candle_gap(last_record_utc, now_utc, interval_ms)
+            time_diff = open_candle_start - last_record_utc
 
             logger.info(f"Time difference: {time_diff}")
             logger.info(f"Missing CLOSED candles: {missing_candles}")
@@ -279,58 +289,37 @@ class RealtimeDataCollector:
                 return
 
             logger.info(f"Found gap of {missing_candles} candles ({time_diff})")
-            logger.info(f"Filling from {last_record} to {now}")
+            logger.info(f"Filling from {last_record_utc} to {now_utc} (UTC)")
 
             # Fetch missing candles using REST API
-            start_ms = int((last_record.timestamp() + 300) * 1000)  # +5 minutes in milliseconds
-            end_ms = int(now.timestamp() * 1000)
-
-            klines = self.client.get_historical_klines(
-                symbol=self.symbol,
-                interval=self.interval,
-                start_str=str(start_ms),
-                end_str=str(end_ms),
-                limit=1000
-            )
+            start_ms = int(last_record_utc.timestamp() * 1000) + interval_ms
+            end_ms = int(open_candle_start.timestamp() * 1000) - 1  # closed candles only
+
+            # One get_klines call per 1000 candles (a gap is usually a single request)
+            klines = []
+            window_ms = 1000 * interval_ms
+            while start_ms <= end_ms:
+                klines.extend(self.client.get_klines(
+                    symbol=self.symbol,
+                    interval=self.interval,
+                    startTime=start_ms,
+                    endTime=min(start_ms + window_ms - 1, end_ms),
+                    limit=1000
+                ))
+                start_ms += window_ms
 
             if not klines:
                 logger.warning("No klines returned from Binance for gap fill")
                 return
 
-            # Save to database
-            saved_count = 0
-            with db.get_session() as session:
-                from sqlalchemy import and_
-
-                for kline in klines:
-                    from datetime import timezone as tz
-                    utc_time = datetime.fromtimestamp(kline[0] / 1000, tz=tz.utc)
-                    turkey_time = utc_time + timedelta(hours=3)  # Add 3 hours for Turkey time
-
-                    # Check if already exists (using Turkey timestamp)
-                    existing = session.query(OHLCVData).filter(
-                        and_(
-                            OHLCVData.timestamp_turkey == turkey_time,
-                            OHLCVData.symbol == self.symbol,
-                            OHLCVData.timeframe == self.interval
-                        )
-                    ).first()
-
-                    if not existing:
-                        ohlcv = OHLCVData(
-                            timestamp_utc=utc_time,
-                            timestamp_turkey=turkey_time,
-                            symbol=self.symbol,
-                            timeframe=self.interval,
-                            open=float(kline[1]),
-                            high=float(kline[2]),
-                            low=float(kline[3]),
-                            close=float(kline[4]),
-                            volume=float(kline[5])
-                        )
-                        session.add(ohlcv)
-                        saved_count += 1
+            # Save to database with one bulk upsert
+            rows = [
+                OHLCVData.row_from_binance_kline(kline, self.symbol, self.interval)
+                for kline in klines
+            ]
 
+            with db.get_session() as session:
+                saved_count = upsert_klines(session, rows)
                 session.commit()
 
             logger.info(f"✓ Filled {saved_count} missing candles before starting WebSocket")
@@ -338,13 +327,10 @@ class RealtimeDataCollector:
         except Exception as e:
             logger.error(f"Error filling missing candles: {e}")
 
-    def stop(self):
-        """Stop the collector"""
-        logger.info("Stopping Real-time Data Collector")
-        self.is_running = False
-
-        if self.websocket:
-            asyncio.create_task(self.websocket.close())
+    def close(self):
+        """Release the collector's database session"""
+        if self._db_session is not None:
+            self._db_session.close()
 
     async def fetch_and_save_current_kline(self):
         """
@@ -365,50 +351,16 @@ class RealtimeDataCollector:
                 # Save the second-to-last kline (which is definitely closed)
                 closed_kline = klines[-2]
 
-                with db.get_session() as session:
-                    from sqlalchemy import and_
-                    from datetime import timezone as tz
-
-                    # Create timestamps (UTC and Turkey)
-                    utc_time = datetime.fromtimestamp(closed_kline[0] / 1000, tz=tz.utc)
-                    turkey_time = utc_time + timedelta(hours=3)  # Add 3 hours for Turkey time
-
-                    # Check if already exists (using Turkey timestamp)
-                    existing = session.query(OHLCVData).filter(
-                        and_(
-                            OHLCVData.timestamp_turkey == turkey_time,
-                            OHLCVData.symbol == self.symbol,
-                            OHLCVData.timeframe == self.interval
-                        )
-                    ).first()
-
-                    if existing:
-                        # Update existing
-                        existing.timestamp_utc = utc_time
-                        existing.open = float(closed_kline[1])
-                        existing.high = float(closed_kline[2])
-                        existing.low = float(closed_kline[3])
-                        existing.close = float(closed_kline[4])
-                        existing.volume = float(closed_kline[5])
-                        close_price = existing.close
-                    else:
-                        # Create new record inside session
-                        ohlcv = OHLCVData(
-                            timestamp_utc=utc_time,
-                            timestamp_turkey=turkey_time,
-                            symbol=self.symbol,
-                            timeframe=self.interval,
-                            open=float(closed_kline[1]),
-                            high=float(closed_kline[2]),
-                            low=float(closed_kline[3]),
-                            close=float(closed_kline[4]),
-                            volume=float(closed_kline[5])
-                        )
-                        session.add(ohlcv)
-                        close_price = ohlcv.close
+                row = OHLCVData.row_from_binance_kline(closed_kline, self.symbol, self.interval)
 
+                with db.get_session() as session:
+                    upsert_klines(session, [row])
                     session.commit()
-                    logger.info(f"Saved current kline: Turkey: {turkey_time} | UTC: {utc_time} - ${float(close_price):.2f}")
+
+                logger.info(
+                    f"Saved current kline: Turkey: {row['timestamp_utc'] + TURKEY_OFFSET} | "
+                    f"UTC: {row['timestamp_utc']} - ${float(row['close']):.2f}"
+                )
 
                 return True
 
@@ -417,6 +369,191 @@ class RealtimeDataCollector:
             return False
 
 
+class MultiSymbolCollector:
+    """
+    Streams klines for all symbols over one combined Binance WebSocket connection
+    Each payload is dispatched to the RealtimeDataCollector of its symbol
+    """
+
+    def __init__(
+        self,
+        symbols: List[str],
+        api_key: Optional[str] = None,
+        api_secret: Optional[str] = None,
+        writer: Optional[KlineWriter] = None
+    ):
+        """
+        Initialize combined-stream collector
+
+        Args:
+            symbols: Trading pairs to stream (e.g. ['BTCUSDT', 'ETHUSDT'])
+            writer: Shared batch writer for closed candles (default: save each candle directly)
+        """
+        self.symbols = symbols
+        self.interval = Config.INTERVAL
+
+        # Per-symbol collectors handle gap fill and storage, this class only owns the socket
+        self.collectors: Dict[str, RealtimeDataCollector] = {
+            symbol: RealtimeDataCollector(symbol, api_key, api_secret, writer=writer)
+            for symbol in symbols
+        }
+
+        # Combined stream URL
+        # Format: wss://stream.binance.com:9443/stream?streams=<symbol>@kline_<interval>/...
+        streams = "/".join(f"{symbol.lower()}@kline_{self.interval}" for symbol in symbols)
+        self.ws_url = f"wss://stream.binance.com:9443/stream?streams={streams}"
+
+        # Connection state
+        self.is_running = False
+        self.websocket = None
+
+        logger.info(f"Multi-symbol collector initialized for {', '.join(symbols)} ({self.interval})")
+        logger.info(f"WebSocket URL: {self.ws_url}")
+
+    async def handle_message(self, message: str):
+        """
+        Handle incoming combined-stream message
+
+        Args:
+            message: Raw WebSocket message ({"stream": ..., "data": {...}})
+        """
+        # Only closed candles are stored, skip parsing the in-progress updates
+        if CLOSED_KLINE_MARKER not in message:
+            if DEBUG_ENABLED:
+                logger.debug(f"Candle update | {message}")
+            return
+
+        try:
+            payload = json_loads(message)['data']
+
+            collector = self.collectors.get(payload.get('s'))
+            if collector is None:
+                logger.warning(f"Message for unknown symbol: {payload.get('s')}")
+                return
+
+            await collector.handle_kline_event(payload)
+
+        except json.JSONDecodeError as e:
+            logger.error(f"Error decoding WebSocket message: {e}")
+        except Exception as e:
+            logger.error(f"Error handling message: {e}")
+
+    async def _consume_messages(self, queue: asyncio.Queue):
+        """Process received WebSocket frames in order, off the receive loop"""
+        while True:
+            message = await queue.get()
+            try:
+                await self.handle_message(message)
+            finally:
+                queue.task_done()
+
+    async def connect_and_stream(self):
+        """
+        Connect to the combined WebSocket and start streaming data
+        Automatically reconnects on connection loss
+        """
+        retry_count = 0
+        max_retries = 5
+        retry_delay = 5  # seconds
+
+        # Frames are handled by a separate consumer task so a slow save never delays the next receive
+        queue: asyncio.Queue = asyncio.Queue(maxsize=1000)
+        consumer = asyncio.create_task(self._consume_messages(queue))
+
+        try:
+            while self.is_running and retry_count < max_retries:
+                try:
+                    logger.info(f"Connecting to Binance WebSocket... (Attempt {retry_count + 1})")
+
+                    async with websockets.connect(self.ws_url) as websocket:
+                        self.websocket = websocket
+                        logger.info("✓ Connected to Binance WebSocket")
+                        logger.info(f"Streaming {', '.join(self.symbols)} {self.interval} candles...")
+
+                        # Reset retry count on successful connection
+                        retry_count = 0
+
+                        # Listen for messages
+                        async for message in websocket:
+                            if not self.is_running:
+                                break
+                            await queue.put(message)
+
+                except websockets.exceptions.ConnectionClosed as e:
+                    logger.warning(f"WebSocket connection closed: {e}")
+                    retry_count += 1
+
+                    if retry_count < max_retries:
+                        logger.info(f"Reconnecting in {retry_delay} seconds...")
+                        await asyncio.sleep(retry_delay)
+                    else:
+                        logger.error("Max retries reached. Stopping collector.")
+                        self.is_running = False
+
+                except Exception as e:
+                    logger.error(f"WebSocket error: {e}")
+                    retry_count += 1
+
+                    if retry_count < max_retries:
+                        logger.info(f"Retrying in {retry_delay} seconds...")
+                        await asyncio.sleep(retry_delay)
+                    else:
+                        logger.error("Max retries reached. Stopping collector.")
+                        self.is_running = False
+        finally:
+            # Handle frames already received, then stop the consumer
+            await queue.join()
+            consumer.cancel()
+            await asyncio.gather(consumer, return_exceptions=True)
+
+    async def fetch_and_save_current_klines(self):
+        """Fetch and save the latest closed kline for every symbol"""
+        for collector in self.collectors.values():
+            await collector.fetch_and_save_current_kline()
+
+    async def start(self):
+        """Start the combined real-time data collector"""
+        logger.info("Starting Multi-symbol Real-time Data Collector")
+
+        # Test database connection
+        if not db.test_connection():
+            logger.error("Database connection failed. Cannot start collector.")
+            return
+
+        # Create tables if they don't exist
+        db.create_tables()
+
+        # IMPORTANT: Fill any missing candles before starting WebSocket
+        # Each fill runs in its own thread, so the symbols are filled concurrently
+        logger.info("Checking for missing candles before real-time stream...")
+        await asyncio.gather(
+            *(collector.fill_missing_candles_before_start() for collector in self.collectors.values())
+        )
+
+        # Start streaming
+        self.is_running = True
+
+        try:
+            await self.connect_and_stream()
+        except KeyboardInterrupt:
+            logger.info("Received interrupt signal. Stopping collector...")
+            self.stop()
+        except Exception as e:
+            logger.error(f"Unexpected error: {e}")
+            self.stop()
+
+    def stop(self):
+        """Stop the collector"""
+        logger.info("Stopping Multi-symbol Real-time Data Collector")
+        self.is_running = False
+
+        for collector in self.collectors.values():
+            collector.close()
+
+        if self.websocket:
+            asyncio.create_task(self.websocket.close())
+
+
 async def main():
     """Main function for running the real-time collector"""
     logger.info("="*60)
@@ -426,22 +563,34 @@ async def main():
     logger.info(f"Update Frequency: Every {Config.UPDATE_FREQUENCY_MINUTES} minutes")
     logger.info("="*60)
 
-    # Create collectors for all symbols
-    collectors = [RealtimeDataCollector(symbol=symbol) for symbol in Config.SYMBOLS]
+    # One combined stream for all symbols, closed candles go through one shared writer
+    writer = KlineWriter()
+    collector = MultiSymbolCollector(Config.SYMBOLS, writer=writer)
 
     # Fetch current klines for all symbols
-    for collector in collectors:
-        await collector.fetch_and_save_current_kline()
+    await collector.fetch_and_save_current_klines()
 
-    # Start all collectors concurrently
-    tasks = [collector.start() for collector in collectors]
-    await asyncio.gather(*tasks)
+    # Start the collector and the writer concurrently
+    writer_task = asyncio.create_task(writer.run())
+    try:
+        await collector.start()
+    finally:
+        writer_task.cancel()
+        await asyncio.gather(writer_task, return_exceptions=True)
 
 
 if __name__ == "__main__":
+    try:
+        # uvloop runs the WebSocket event loop with far less per-callback overhead (not available on Windows)
+        import uvloop
+        new_event_loop = uvloop.new_event_loop
+    except ImportError:
+        new_event_loop = None  # asyncio default loop
+
     try:
         # Run the async main function
-        asyncio.run(main())
+        with asyncio.Runner(loop_factory=new_event_loop) as runner:
+            runner.run(main())
     except KeyboardInterrupt:
         logger.info("\nCollector stopped by user")
     except Exception as e:
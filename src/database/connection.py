@@ -2,17 +2,22 @@
 Database connection manager using SQLAlchemy
 Provides connection pooling and session management
 """
-from sqlalchemy import create_engine, event
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.ext.declarative import declarative_base
 from contextlib import contextmanager
-from typing import Generator
+from typing import Callable, Generator, Optional, TypeVar
+import time
 
+from .migrations import apply_migrations
 from ..utils.config import Config
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+T = TypeVar('T')
+
 # Create base class for declarative models
 Base = declarative_base()
 
@@ -30,9 +35,10 @@ class DatabaseConnection:
             # Create engine with connection pooling
             self.engine = create_engine(
                 Config.DATABASE_URL,
-                pool_size=10,  # Number of connections to keep open
-                max_overflow=20,  # Max additional connections
+                pool_size=Config.DB_POOL_SIZE,  # Number of connections to keep open
+                max_overflow=Config.DB_MAX_OVERFLOW,  # Max additional connections
                 pool_timeout=30,  # Timeout for getting connection from pool
+                pool_recycle=Config.DB_POOL_RECYCLE,  # Replace connections older than this (seconds)
                 pool_pre_ping=True,  # Verify connections before using
                 echo=False  # Set to True for SQL query logging
             )
@@ -54,6 +60,7 @@ class DatabaseConnection:
         """Create all tables defined in models"""
         try:
             Base.metadata.create_all(bind=self.engine)
+            apply_migrations(self.engine)
             logger.info("Database tables created successfully")
         except Exception as e:
             logger.error(f"Failed to create tables: {e}")
@@ -78,10 +85,13 @@ class DatabaseConnection:
         finally:
             session.close()
 
+    def persistent_session(self, recycle: int = 3600) -> 'PersistentSession':
+        """Create a long-lived session for frequent small writes (see PersistentSession)"""
+        return PersistentSession(self, recycle)
+
     def test_connection(self) -> bool:
         """Test database connection"""
         try:
-            from sqlalchemy import text
             with self.get_session() as session:
                 session.execute(text("SELECT 1"))
             logger.info("Database connection test successful")
@@ -97,5 +107,78 @@ class DatabaseConnection:
             logger.info("Database connection closed")
 
 
+class PersistentSession:
+    """
+    Session that keeps one pooled connection checked out across many writes
+    Avoids the pool checkout and pre-ping SELECT 1 of get_session() on every save
+    """
+
+    def __init__(self, database: DatabaseConnection, recycle: int = 3600):
+        """
+        Args:
+            database: Connection manager providing the engine and session factory
+            recycle: Reopen the connection after this many seconds (avoids stale connections)
+        """
+        self.database = database
+        self.recycle = recycle
+        self._connection = None
+        self._session: Optional[Session] = None
+        self._opened_at = 0.0
+
+    def _open(self):
+        """Check out a connection and bind a new session to it"""
+        self._connection = self.database.engine.connect()
+        self._session = self.database.SessionLocal(bind=self._connection)
+        self._opened_at = time.monotonic()
+
+    @contextmanager
+    def get_session(self) -> Generator[Session, None, None]:
+        """
+        Context manager like DatabaseConnection.get_session, but the session stays open
+        Commits on success; on error rolls back and drops the connection so the next use reconnects
+        """
+        if self._session is None or time.monotonic() - self._opened_at > self.recycle:
+            self.close()
+            self._open()
+
+        try:
+            yield self._session
+            self._session.commit()
+        except Exception as e:
+            logger.error(f"Database session error: {e}")
+            self.close()
+            raise
+
+    def run(self, work: Callable[[Session], T]) -> T:
+        """
+        Run work(session) and commit, reconnecting and retrying once if the connection was dropped
+
+        The connection stays checked out, so pool_pre_ping never checks it; after an idle
+        timeout, database restart or NAT drop the first write fails with a disconnect.
+        Without the retry those rows would be lost.
+        """
+        try:
+            with self.get_session() as session:
+                return work(session)
+        except DBAPIError as e:
+            if not e.connection_invalidated:
+                raise
+            logger.warning("Database connection was lost, retrying on a new connection")
+
+        with self.get_session() as session:
+            return work(session)
+
+    def close(self):
+        """Close the session and return its connection to the pool"""
+        if self._session is not None:
+            try:
+                self._session.close()
+                self._connection.close()
+            except Exception as e:
+                logger.warning(f"Error closing persistent session: {e}")
+            self._session = None
+            self._connection = None
+
+
 # Global database instance
 db = DatabaseConnection()
@@ -0,0 +1,76 @@
+"""
+Schema migrations for SafeTradeLab
+Brings tables created by older versions in line with the current models
+"""
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Idempotent statements, applied in order after create_all
+# (create_all only creates missing tables, it never alters existing ones)
+MIGRATIONS = [
+    # Composite index for MAX(timestamp_utc) and range scans per symbol/timeframe
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_ohlcv_symbol_timeframe_utc "
+    "ON ohlcv_data (symbol, timeframe, timestamp_utc DESC)",
+
+    # Single-column indexes from older models, covered by the two composite ones
+    "DROP INDEX CONCURRENTLY IF EXISTS ix_ohlcv_data_timestamp_utc",
+    "DROP INDEX CONCURRENTLY IF EXISTS ix_ohlcv_data_timestamp_turkey",
+    "DROP INDEX CONCURRENTLY IF EXISTS ix_ohlcv_data_symbol",
+
+    # Previous composite index on timestamp_turkey, replaced by ix_ohlcv_symbol_timeframe_utc
+    "DROP INDEX CONCURRENTLY IF EXISTS ix_ohlcv_symbol_timeframe_ts",
+
+    # OHLCV columns: NUMERIC(20, 8) -> DOUBLE PRECISION (one table rewrite, skipped once converted)
+    """
+    DO $$
+    BEGIN
+        IF EXISTS (
+            SELECT 1 FROM information_schema.columns
+            WHERE table_name = 'ohlcv_data' AND column_name = 'close' AND data_type = 'numeric'
+        ) THEN
+            ALTER TABLE ohlcv_data
+                ALTER COLUMN open TYPE double precision USING open::double precision,
+                ALTER COLUMN high TYPE double precision USING high::double precision,
+                ALTER COLUMN low TYPE double precision USING low::double precision,
+                ALTER COLUMN close TYPE double precision USING close::double precision,
+                ALTER COLUMN volume TYPE double precision USING volume::double precision;
+        END IF;
+    END
+    $$
+    """,
+
+    # timestamp_turkey: stored copy -> generated column, unique key moves to timestamp_utc
+    # (dropping the column also drops the old unique constraint on it)
+    """
+    DO $$
+    BEGIN
+        IF EXISTS (
+            SELECT 1 FROM information_schema.columns
+            WHERE table_name = 'ohlcv_data' AND column_name = 'timestamp_turkey' AND is_generated = 'NEVER'
+        ) THEN
+            ALTER TABLE ohlcv_data DROP COLUMN timestamp_turkey;
+            ALTER TABLE ohlcv_data
+                ADD COLUMN timestamp_turkey TIMESTAMP WITH TIME ZONE
+                GENERATED ALWAYS AS (((timestamp_utc AT TIME ZONE 'UTC') + interval '3 hours') AT TIME ZONE 'UTC')
+                STORED NOT NULL;
+            ALTER TABLE ohlcv_data
+                ADD CONSTRAINT uix_timestamp_symbol_timeframe UNIQUE (timestamp_utc, symbol, timeframe);
+        END IF;
+    END
+    $$
+    """,
+]
+
+
+def apply_migrations(engine: Engine):
+    """Apply pending schema migrations to an existing database"""
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        for statement in MIGRATIONS:
+            connection.execute(text(statement))
+
+    logger.info("Database migrations applied")
@@ -2,13 +2,25 @@
 Database models for SafeTradeLab
 Defines the structure of OHLCV data table
 """
-from sqlalchemy import Column, Integer, String, Numeric, DateTime, UniqueConstraint
+from sqlalchemy import Column, Integer, String, Float, DateTime, UniqueConstraint, Index, Computed, literal_column
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
 from sqlalchemy.sql import func
 from datetime import datetime, timezone, timedelta
-from typing import Dict, Any
+from operator import itemgetter
+from typing import Dict, Any, List, Union
 
 from .connection import Base
 
+# Binance REST kline fields used for storage: (open_time, open, high, low, close, volume)
+KLINE_FIELDS = itemgetter(0, 1, 2, 3, 4, 5)
+
+# Turkey time is UTC + 3 hours (still tagged UTC), used when logging Turkey time
+TURKEY_OFFSET = timedelta(hours=3)
+
+# Server-side expression for timestamp_turkey (must be immutable, so shift the naive UTC time)
+TURKEY_TIME_SQL = "((timestamp_utc AT TIME ZONE 'UTC') + interval '3 hours') AT TIME ZONE 'UTC'"
+
 class OHLCVData(Base):
     """
     OHLCV (Open, High, Low, Close, Volume) data model
@@ -20,25 +32,29 @@ class OHLCVData(Base):
     id = Column(Integer, primary_key=True, autoincrement=True)
 
     # Timestamps - UTC (Binance time) and Turkey time
-    timestamp_utc = Column(DateTime(timezone=True), nullable=False, index=True)
-    timestamp_turkey = Column(DateTime(timezone=True), nullable=False, index=True)
+    # timestamp_turkey is generated by PostgreSQL from timestamp_utc, never written by the app
+    timestamp_utc = Column(DateTime(timezone=True), nullable=False)
+    timestamp_turkey = Column(DateTime(timezone=True), Computed(TURKEY_TIME_SQL, persisted=True), nullable=False)
 
-    symbol = Column(String(20), nullable=False, index=True)
+    symbol = Column(String(20), nullable=False)
     timeframe = Column(String(5), nullable=False, default='5m')
 
-    # OHLCV data
-    open = Column(Numeric(20, 8), nullable=False)
-    high = Column(Numeric(20, 8), nullable=False)
-    low = Column(Numeric(20, 8), nullable=False)
-    close = Column(Numeric(20, 8), nullable=False)
-    volume = Column(Numeric(20, 8), nullable=False)
+    # OHLCV data (DOUBLE PRECISION: plain floats, no Decimal round-trip)
+    open = Column(Float(asdecimal=False), nullable=False)
+    high = Column(Float(asdecimal=False), nullable=False)
+    low = Column(Float(asdecimal=False), nullable=False)
+    close = Column(Float(asdecimal=False), nullable=False)
+    volume = Column(Float(asdecimal=False), nullable=False)
 
     # Metadata
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
-    # Unique constraint: one record per timestamp_turkey, symbol, and timeframe
+    # Unique constraint: one record per timestamp_utc, symbol, and timeframe
+    # Composite index: latest-record lookups (MAX timestamp_utc) per symbol/timeframe
+    # No single-column indexes, these two cover every query and each extra index slows inserts
     __table_args__ = (
-        UniqueConstraint('timestamp_turkey', 'symbol', 'timeframe', name='uix_timestamp_symbol_timeframe'),
+        UniqueConstraint('timestamp_utc', 'symbol', 'timeframe', name='uix_timestamp_symbol_timeframe'),
+        Index('ix_ohlcv_symbol_timeframe_utc', 'symbol', 'timeframe', timestamp_utc.desc()),
     )
 
     def __repr__(self) -> str:
@@ -55,37 +71,75 @@ class OHLCVData(Base):
             'timestamp_turkey': self.timestamp_turkey.isoformat() if self.timestamp_turkey else None,
             'symbol': self.symbol,
             'timeframe': self.timeframe,
-            'open': float(self.open) if self.open else None,
-            'high': float(self.high) if self.high else None,
-            'low': float(self.low) if self.low else None,
-            'close': float(self.close) if self.close else None,
-            'volume': float(self.volume) if self.volume else None,
+            'open': self.open,
+            'high': self.high,
+            'low': self.low,
+            'close': self.close,
+            'volume': self.volume,
             'created_at': self.created_at.isoformat() if self.created_at else None
         }
 
+    @staticmethod
+    def row_from_binance_kline(kline: list, symbol: str, timeframe: str = '5m') -> Dict[str, Any]:
+        """
+        Build a column -> value mapping from Binance kline data
+        Suitable for Core/bulk inserts without creating ORM objects
+        Binance kline format: [timestamp, open, high, low, close, volume, ...]
+        """
+        open_ms, open_, high, low, close, volume = KLINE_FIELDS(kline)
+
+        # UTC timestamp from Binance (timestamp_turkey is generated from it by PostgreSQL)
+        utc_time = datetime.fromtimestamp(open_ms / 1000, tz=timezone.utc)
+
+        return {
+            'timestamp_utc': utc_time,
+            'symbol': symbol,
+            'timeframe': timeframe,
+            'open': open_,
+            'high': high,
+            'low': low,
+            'close': close,
+            'volume': volume
+        }
+
     @classmethod
     def from_binance_kline(cls, kline: list, symbol: str, timeframe: str = '5m'):
         """
         Create OHLCVData instance from Binance kline data
         Binance kline format: [timestamp, open, high, low, close, volume, ...]
         """
-        from datetime import timedelta
-
-        # UTC timestamp from Binance
-        utc_time = datetime.fromtimestamp(kline[0] / 1000, tz=timezone.utc)
-
-        # Convert to Turkey time by adding 3 hours (keep as UTC timezone but with +3 hours)
-        # This way PostgreSQL will show the actual Turkey time
-        turkey_time = utc_time + timedelta(hours=3)
-
-        return cls(
-            timestamp_utc=utc_time,
-            timestamp_turkey=turkey_time,
-            symbol=symbol,
-            timeframe=timeframe,
-            open=kline[1],
-            high=kline[2],
-            low=kline[3],
-            close=kline[4],
-            volume=kline[5]
-        )
+        return cls(**cls.row_from_binance_kline(kline, symbol, timeframe))
+
+
+def upsert_klines(session: Session, rows: List[Dict[str, Any]], return_inserted: bool = False) -> Union[int, List[bool]]:
+    """
+    Insert candles, updating any that already exist, with a single statement
+    Shared by every save path so the conflict target and updated columns live in one place
+    (the caller commits)
+
+    Args:
+        session: Database session
+        rows: OHLCVData column mappings (see OHLCVData.row_from_binance_kline)
+        return_inserted: Return one flag per row, True if it was new, False if it was updated
+
+    Returns:
+        Number of rows inserted or updated, or the per-row flags if return_inserted is set
+    """
+    stmt = pg_insert(OHLCVData.__table__).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        constraint='uix_timestamp_symbol_timeframe',
+        set_={
+            'open': stmt.excluded.open,
+            'high': stmt.excluded.high,
+            'low': stmt.excluded.low,
+            'close': stmt.excluded.close,
+            'volume': stmt.excluded.volume
+        }
+    )
+
+    if not return_inserted:
+        return session.execute(stmt).rowcount
+
+    # xmax = 0 only for freshly inserted rows, so new and updated rows can be told apart
+    stmt = stmt.returning(literal_column('xmax = 0').label('inserted'))
+    return session.execute(stmt).scalars().all()
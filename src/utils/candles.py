@@ -0,0 +1,34 @@
+"""
+Candle time arithmetic shared by the historical and real-time collectors
+All times are UTC, intervals are in milliseconds
+"""
+from datetime import datetime, timezone
+from typing import Tuple
+
+
+def candle_start_ms(ts_ms: int, interval_ms: int) -> int:
+    """Open time (ms) of the candle containing ts_ms"""
+    return (ts_ms // interval_ms) * interval_ms
+
+
+def closed_candle_gap(last_open_utc: datetime, now_utc: datetime, interval_ms: int) -> Tuple[datetime, int]:
+    """
+    Count the closed candles missing after the last stored one
+
+    Only CLOSED candles are counted: the candle still forming starts at
+    open_candle_start, and the last stored candle is the one that opened
+    at last_open_utc, so neither end of the gap is included.
+
+    Args:
+        last_open_utc: Open time of the last stored candle
+        now_utc: Current time
+        interval_ms: Candle interval
+
+    Returns:
+        (open_candle_start, missing_candles)
+    """
+    open_candle_start = datetime.fromtimestamp(
+        candle_start_ms(int(now_utc.timestamp() * 1000), interval_ms) / 1000, tz=timezone.utc
+    )
+    gap_ms = int((open_candle_start - last_open_utc).total_seconds() * 1000)
+    return open_candle_start, max(0, gap_ms // interval_ms - 1)
@@ -28,6 +28,11 @@ class Config:
     DB_USER = os.getenv('DB_USER', 'postgres')
     DB_PASSWORD = os.getenv('DB_PASSWORD', 'safetradelab123')
 
+    # Connection pool (sized for concurrent per-symbol writers)
+    DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', '8'))
+    DB_MAX_OVERFLOW = int(os.getenv('DB_MAX_OVERFLOW', '4'))
+    DB_POOL_RECYCLE = int(os.getenv('DB_POOL_RECYCLE', '1800'))  # seconds
+
     # Alternative: Use DATABASE_URL if provided
     DATABASE_URL = os.getenv(
         'DATABASE_URL',
@@ -24,7 +24,10 @@ logger.add(
     level=Config.LOG_LEVEL,
     rotation="1 day",  # Rotate daily
     retention="30 days",  # Keep logs for 30 days
-    compression="zip"  # Compress old logs
+    compression="gz",  # Compress old logs (gzip is faster than zip)
+    enqueue=True,  # Write from a background worker, file I/O never blocks the event loop
+    backtrace=False,  # No extended tracebacks
+    diagnose=False  # No variable values in tracebacks
 )
 
 def get_logger(name: str):